@@ -1,26 +1,48 @@
 from collections import namedtuple
-from logging import getLogger
-from typing import Any, ClassVar, Optional, Type, override
+from functools import update_wrapper
+from logging import WARNING, getLogger
+from operator import attrgetter
+from types import FunctionType
+from typing import Any, ClassVar, Optional, Type, cast, override
 
 from django.contrib import messages
 from django.contrib.admin import ModelAdmin, action, display
+from django.contrib.admin.utils import unquote
 from django.contrib.auth import get_permission_codename
-from django.contrib.auth.models import Permission, User
-from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import models, router, transaction
 from django.db.models import Model, QuerySet
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
+from django_lockmin.checks import AdminLockingMixinChecks
 from django_lockmin.typing import PermissionType
 
 
 log = getLogger(__name__)
 
 
+def _copy_function(func: FunctionType, **attributes: object) -> FunctionType:
+    """
+    Copies a function, along with its attributes, and sets any additional attributes on the copy.
+    """
+    copied = FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    update_wrapper(copied, func)
+    copied.__kwdefaults__ = func.__kwdefaults__
+    copied.__dict__.update(attributes)
+    return copied
+
+
 class AdminLockingMixin(ModelAdmin):
     """
     Provides functionality to "lock" a record from being accessed or changed.
@@ -43,6 +65,9 @@ class AdminLockingMixin(ModelAdmin):
         Specify the error message displayed to the user if they try to access an already locked
         record that's not assigned to themselves. This works regardless of the setting of
         `allow_view_permissions`.
+    :param lock_single_record_error_msg:
+        Specify the error message displayed to the user if they try to lock either no records or
+        more than one record at once with the lock action.
     :param user_field:
         The name of the model field you are building a locking mechanism for that has a foreign
         key to the User table.
@@ -55,7 +80,8 @@ class AdminLockingMixin(ModelAdmin):
         Specify the display name of the unlock action.
     :param unlock_record_action_permission:
         Specify any special permissions that are needed to unlock a record. These permissions
-        will be created automatically for you by default. If you prefer a different name for the
+        will be created automatically for you by default when running `migrate`, as long as
+        `django_lockmin` is in your `INSTALLED_APPS`. If you prefer a different name for the
         unlocking permission then set this here. If you don't want special controls, then set
         this as None which will give every user access to this admin view unlocking controls.
 
@@ -81,6 +107,7 @@ class AdminLockingMixin(ModelAdmin):
         f"You can only lock upto {max_records_lockable} record(s)"
     )
     locked_error_msg: str = "This record is locked. Please try again later."
+    lock_single_record_error_msg: str = "Please select exactly one record to lock."
     user_field: str = "user"
     locking_help: Optional[str] = None
     lock_record_action_name: str = "Lock Record"
@@ -89,6 +116,9 @@ class AdminLockingMixin(ModelAdmin):
         codename="unlock", description="Can unlock a record."
     )
 
+    # Validates the locking configuration once at start up, as part of Django's system checks.
+    checks_class = AdminLockingMixinChecks
+
     # Force users to use the actions to lock the record.
     list_display_links = None
 
@@ -97,6 +127,25 @@ class AdminLockingMixin(ModelAdmin):
     UNLOCK_RECORD: ClassVar[str] = "unlock_record"
     LOCK_RECORD: ClassVar[str] = "lock_record"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Gives each admin class its own copy of the locking actions and the `is_locked_by` column,
+        labelled and ordered from that class's configuration, so admin views never share or
+        overwrite each other's settings. Methods that a subclass defines itself are left alone.
+        """
+        super().__init_subclass__(**kwargs)
+
+        for name, attributes in (
+            (cls.UNLOCK_RECORD, {"short_description": cls.unlock_record_action_name}),
+            (cls.LOCK_RECORD, {"short_description": cls.lock_record_action_name}),
+            (
+                cls.LOCKED_BY_COLUMN,
+                {"admin_order_field": f"-{cls.user_field}__last_name"},
+            ),
+        ):
+            if name not in cls.__dict__:
+                setattr(cls, name, _copy_function(getattr(cls, name), **attributes))
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
         Adds additional components to the admin view specifically about the locking mechanism.
@@ -109,101 +158,87 @@ class AdminLockingMixin(ModelAdmin):
         """
         super().__init__(*args, **kwargs)
 
-        # Dynamically register the `is_locked_by` list column.
-        if not self.list_display:
-            self.list_display = (self.LOCKED_BY_COLUMN,)
-        elif self.LOCKED_BY_COLUMN not in self.list_display:
-            self.list_display += (self.LOCKED_BY_COLUMN,)  # type: ignore[operator]
-
-        # Dynamically register the action to unlock a record.
-        if not self.actions:
-            self.actions = (self.UNLOCK_RECORD,)
-        elif self.UNLOCK_RECORD not in self.actions:
-            self.actions += (self.UNLOCK_RECORD,)  # type: ignore[operator]
-        AdminLockingMixin.unlock_record.short_description = (  # type: ignore[attr-defined]
-            self.unlock_record_action_name
+        # Dynamically register the `is_locked_by` list column. Always assign a new tuple to the
+        # instance, so the class-level `list_display` is never shared or grown between admins.
+        list_display = tuple(self.list_display) if self.list_display else ()
+        if self.LOCKED_BY_COLUMN not in list_display:
+            list_display += (self.LOCKED_BY_COLUMN,)
+        self.list_display = list_display
+
+        # Dynamically register the actions to unlock and lock a record, again on the instance.
+        actions = tuple(self.actions) if self.actions else ()
+        extra_actions = tuple(
+            name
+            for name in (self.UNLOCK_RECORD, self.LOCK_RECORD)
+            if name not in actions
         )
+        self.actions = actions + extra_actions
 
-        # Dynamically register the action to lock a record.
-        if not self.actions:
-            self.actions = (self.LOCK_RECORD,)
-        elif self.LOCK_RECORD not in self.actions:
-            self.actions += (self.LOCK_RECORD,)  # type: ignore[operator]
-        AdminLockingMixin.lock_record.short_description = (  # type: ignore[attr-defined]
-            self.lock_record_action_name
+        # The user field is constant for the admin, so build the (C implemented) accessors for the
+        # hot per-row code paths once.
+        self._user_attrgetter = attrgetter(self.user_field)
+        self._user_id_attrgetter = attrgetter(f"{self.user_field}_id")
+
+        # The URL name of the change view is constant for the model.
+        self._change_view_url_name = (
+            f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_change"
         )
 
-        self._validate_user_field()
+        # The full codename only depends on the admin's configuration, so only derive it once.
+        self._unlock_full_codename: Optional[str] = (
+            get_permission_codename(
+                self.unlock_record_action_permission.codename, self.opts
+            )
+            if self.unlock_record_action_permission
+            else None
+        )
 
-    def _get_changeview_url(self, obj: models.Model) -> str:
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
         """
-        Gets the URL of the change view for a specific model record.
+        Join on the user table so the `is_locked_by` column doesn't fetch each user separately.
         """
-        return reverse(
-            f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_change",
-            args=[obj.pk],
-        )
+        return super().get_queryset(request).select_related(self.user_field)
 
-    def _set_unlock_permission(self) -> None:
+    def get_object(
+        self, request: HttpRequest, object_id: str, from_field: Optional[str] = None
+    ) -> Optional[Model]:
         """
-        Sets the user permission for unlocking a record and attaches the relevant method to check a
-        user has the permission.
+        Returns the record claimed by `change_view` during this request, if there is one, to avoid
+        fetching the same record again. The claimed record was first checked against
+        `get_queryset`, so it has already passed the admin's own filtering.
         """
-        if not self.unlock_record_action_permission:
-            return
-
-        full_codename = get_permission_codename(
-            self.unlock_record_action_permission.codename, self.opts
-        )
-
-        # If not already defined, create the "unlock" permission.
-        if not Permission.objects.filter(codename=full_codename).count():
-            content_type = ContentType.objects.get_for_model(self.model)
-            Permission.objects.create(
-                codename=full_codename,
-                name=self.unlock_record_action_permission.description,
-                content_type=content_type,
-            )
+        obj: Optional[Model] = getattr(request, "_lockmin_cached_obj", None)
+        if obj is not None and from_field is None and str(obj.pk) == str(object_id):
+            return obj
+        return super().get_object(request, object_id, from_field=from_field)
 
-        # Link this newly created permission to the specific action method, `unlock_record`.
-        AdminLockingMixin.unlock_record.allowed_permissions = [  # type: ignore[attr-defined]
-            self.unlock_record_action_permission.codename
-        ]
-
-    def _validate_user_field(self) -> None:
+    def _get_changeview_url(self, pk: Any) -> str:
         """
-        Ensure that the model attached to the admin view has a correct user attribute so we can
-        track which user has locked a record.
+        Gets the URL of the change view for a specific model record, given its primary key.
         """
-        if not hasattr(self.model, self.user_field):
-            raise ValueError(
-                f"The `user_field` was set to `{self.user_field}` but that's not a model field of "
-                f"`{self.model.__name__}`"
-            )
-        elif getattr(self.model, self.user_field).field.related_model != User:
-            raise ValueError(
-                f"The `user_field` was set to `{self.user_field}` but that isn't a foreign key to "
-                f"the User table."
-            )
-        return None
+        return reverse(self._change_view_url_name, args=[pk])
 
     def is_locked(self, request: HttpRequest, obj: models.Model) -> bool:
-        user: User = getattr(obj, self.user_field)
         assert request.user, "User must be logged in!"
-        return user.id != request.user.id
+        # Compare against the raw foreign key so we never fetch the related user.
+        return self._user_id_attrgetter(obj) != request.user.pk
 
-    @action
+    # Checked through `has_unlock_permission`, which handles the configured permission codename.
+    @action(description=unlock_record_action_name, permissions=["unlock"])
     def unlock_record(self, request: HttpRequest, queryset: QuerySet) -> None:
         """
         Provides an action ability to unlock a record.
 
         Access should be limited to higher-level users.
+
+        :note: The records are unlocked with a single bulk update, so `Model.save` isn't called and
+        no `pre_save`/`post_save` signals are sent for the unlocked records.
         """
-        for manual_order_attempt in queryset:
-            manual_order_attempt.user = None
-            manual_order_attempt.save(update_fields=["user"])
-        model_references = queryset.values_list(self.model_reference_key, flat=True)
-        model_references_str = ", ".join(model_references)
+        model_references = list(
+            queryset.values_list(self.model_reference_key, flat=True)
+        )
+        queryset.update(**{self.user_field: None})
+        model_references_str = ", ".join(map(str, model_references))
 
         self.message_user(
             request,
@@ -213,7 +248,7 @@ class AdminLockingMixin(ModelAdmin):
 
         return None
 
-    @action
+    @action(description=lock_record_action_name)
     def lock_record(
         self, request: HttpRequest, queryset: QuerySet
     ) -> Optional[HttpResponseRedirect]:
@@ -223,37 +258,50 @@ class AdminLockingMixin(ModelAdmin):
         Using an action to lock a record rather than allowing a user to click on the dashboard
         elements to make it very explicit the action the user is taking.
         """
-        # Joins both the queryset that we want to process as well at the query set of records we
-        # have already locked, incase a user tries to lock the same record they've already locked.
-        all_records_for_user = queryset.union(
-            self.model.objects.filter(**{self.user_field: request.user.pk})
-        )
+        # Only a single record can be opened at a time, and we only need its primary key to build
+        # the URL, so there's no need to fetch the record (or more than two primary keys) here.
+        selected_pks = list(queryset.values_list("pk", flat=True)[:2])
+        if len(selected_pks) != 1:
+            self.message_user(
+                request, message=self.lock_single_record_error_msg, level=messages.ERROR
+            )
+            return None
+        (record_pk,) = selected_pks
+
+        # Combines both the record that we want to process as well as the records we have already
+        # locked, incase a user tries to lock the same record they've already locked. We only need
+        # to know whether the limit is exceeded, so never fetch more locked records than that.
+        locked_pks = self.model.objects.filter(
+            **{f"{self.user_field}_id": request.user.pk}
+        ).values_list("pk", flat=True)[: self.max_records_lockable + 1]
+        total_records_for_user = len({record_pk, *locked_pks})
 
         # Check that we're not requesting to access more records than we're allowed at any one time.
-        if all_records_for_user.count() > self.max_records_lockable:
+        if total_records_for_user > self.max_records_lockable:
             self.message_user(
                 request, message=self.max_records_warning_msg, level=messages.ERROR
             )
             # Optionally allow user to keep viewing a record (commented out).
             # return None
 
-        record = queryset.get()
-        return redirect(self._get_changeview_url(record))
+        return redirect(self._get_changeview_url(record_pk))
 
-    @display(description=_("Locked By"), ordering="-user__last_name")
+    @display(description=_("Locked By"), ordering=f"-{user_field}__last_name")
     def is_locked_by(self, obj: Type[Model]) -> str:
         """
         Display the user who has locked the record.
         """
-        user: Optional[User] = getattr(obj, self.user_field)
-        if not user:
+        if self._user_id_attrgetter(obj) is None:
             return "-"
 
+        user: User = self._user_attrgetter(obj)
         if not user.first_name and not user.last_name:
-            log.warning(
-                f"The user `{user.username}` has no first or last name set. Please set their user "
-                f"details for improved visibility of who's locked a manual order."
-            )
+            # Avoid building the message for every row if warnings aren't being logged anyway.
+            if log.isEnabledFor(WARNING):
+                log.warning(
+                    f"The user `{user.username}` has no first or last name set. Please set their "
+                    f"user details for improved visibility of who's locked a manual order."
+                )
             return user.username
 
         return f"{user.first_name} {user.last_name}"
@@ -284,25 +332,25 @@ class AdminLockingMixin(ModelAdmin):
         """
         Checks to see if the user have the `unlock` permission for the specific model.
 
-        Links to the `unlock_order` method to set the `unlock` permission.
+        Used by the `unlock_record` action, which requires the `unlock` permission.
         """
         if not self.unlock_record_action_permission:
             return True
 
-        codename = get_permission_codename(
-            self.unlock_record_action_permission.codename, self.opts
-        )
-
-        # Avoids having to reload the application and get the latest permissions for the user [0]
+        # Django caches the user's permissions on `request.user`, which is loaded afresh for every
+        # request, so any changes to their permissions are already picked up on the next request [0]
         # [0] https://docs.djangoproject.com/en/5.0/topics/auth/default/#permission-caching
-        user: User = get_object_or_404(User, pk=request.user.id)
-        return user.has_perm("%s.%s" % (self.opts.app_label, codename))
+        user = cast(User, request.user)
+        return user.has_perm(
+            "%s.%s" % (self.opts.app_label, self._unlock_full_codename)
+        )
 
     def get_model_perms(self, request: HttpRequest) -> dict[str, bool]:
         """
         Adds the permission to "unlock" a locked record.
 
-        This will get called not at the point of running the app, but when the admin page is loaded.
+        The permission itself is created when running `migrate`, see
+        `django_lockmin.signals.create_unlock_permissions`.
         """
         perms = super().get_model_perms(request)
 
@@ -310,9 +358,6 @@ class AdminLockingMixin(ModelAdmin):
         if not self.unlock_record_action_permission:
             return perms
 
-        # Initialise the unlock permission.
-        self._set_unlock_permission()
-
         # Append the new "unlock" permission to the set.
         perms[self.unlock_record_action_permission.codename] = (
             self.has_unlock_permission(request)
@@ -331,15 +376,56 @@ class AdminLockingMixin(ModelAdmin):
         Checks to see if an existing record is already being processed by another user and blocks
         any other user from changing the record (and optionally even viewing the record).
         """
-        model = self.model.objects.get(id=object_id)
-        user: User = getattr(model, self.user_field)
-
-        if not user:
-            setattr(model, self.user_field, request.user)
-            model.save(update_fields=[self.user_field])
-            return super().change_view(request, object_id)
-
-        elif self.is_locked(request, model):
+        user = cast(User, request.user)
+
+        # Only read the foreign key of the user who's locked the record, rather than the full row
+        # which will be loaded by the change view itself anyway. Go through `get_queryset` so
+        # records hidden from this user by the admin are never claimed (or shown).
+        try:
+            record = (
+                self.get_queryset(request)
+                .filter(pk=unquote(object_id))
+                .values_list(f"{self.user_field}_id")
+                .first()
+            )
+        except (ValueError, ValidationError):
+            record = None
+
+        # Let Django handle records that don't exist (or malformed ids).
+        if record is None:
+            return super().change_view(request, object_id, form_url, extra_context)
+
+        (user_id,) = record
+        if user_id is None:
+            # Claim the record while holding a row lock, so two users opening the same unlocked
+            # record at the same time can't both end up thinking they've locked it.
+            # The record has already passed the admin's `get_queryset` above, so lock it through
+            # the default manager to keep the `FOR UPDATE` query free of joins, DISTINCT, etc.
+            with transaction.atomic(using=router.db_for_write(self.model)):
+                obj = (
+                    self.model._default_manager.select_for_update()
+                    .filter(pk=unquote(object_id))
+                    .first()
+                )
+
+                # Let Django handle records deleted since we first checked.
+                if obj is None:
+                    return super().change_view(
+                        request, object_id, form_url, extra_context
+                    )
+
+                user_id = self._user_id_attrgetter(obj)
+
+                # Another user may have claimed the record since we first checked.
+                if user_id is None:
+                    setattr(obj, self.user_field, request.user)
+                    obj.save(update_fields=[self.user_field])
+                    user_id = user.pk
+
+                    # Reuse the record we've just claimed when the change view loads it.
+                    request._lockmin_cached_obj = obj  # type: ignore[attr-defined]
+
+        if user_id != user.pk:
             self.message_user(
                 request, message=self.locked_error_msg, level=messages.ERROR
             )
@@ -349,7 +435,7 @@ class AdminLockingMixin(ModelAdmin):
             if not self.allow_view_permissions:
                 return HttpResponseRedirect("../../")
 
-        return super().change_view(request, object_id)
+        return super().change_view(request, object_id, form_url, extra_context)
 
     def changelist_view(
         self, request: HttpRequest, extra_context: Optional[dict[str, Any]] = None
@@ -359,8 +445,11 @@ class AdminLockingMixin(ModelAdmin):
         """
 
         # Give users a helpful one-time only welcome message when they first access the admin
-        # view after logging in.
-        if self.locking_help and not request.session.get("message_seen", False):
-            self.message_user(request, self.locking_help, level=messages.INFO)
-            request.session["message_seen"] = True
+        # view after logging in. Also remember this on the request itself, so we don't need to go
+        # back to the session backend if the changelist is rendered again within this request.
+        if self.locking_help and not getattr(request, "_lockmin_message_seen", False):
+            if not request.session.get("message_seen", False):
+                self.message_user(request, self.locking_help, level=messages.INFO)
+                request.session["message_seen"] = True
+            request._lockmin_message_seen = True  # type: ignore[attr-defined]
         return super().changelist_view(request, extra_context=extra_context)
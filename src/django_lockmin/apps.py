@@ -1,10 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class LockminAppConfig(AppConfig):
     """
-    Used to provide visual improvements when displaying the dashboards in the Admin view.
+    Used to provide visual improvements when displaying the dashboards in the Admin view, and to
+    create the "unlock" permissions after running the migrations.
     """
 
-    name = "lockmin"
+    name = "django_lockmin"
+    label = "lockmin"
     verbose_name = "Django Lockmin"
+
+    def ready(self) -> None:
+        from django_lockmin.signals import create_unlock_permissions
+
+        post_migrate.connect(
+            create_unlock_permissions,
+            dispatch_uid="django_lockmin.create_unlock_permissions",
+        )
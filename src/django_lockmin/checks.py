@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING, Any, cast
+
+from django.apps import apps
+from django.contrib.admin.checks import ModelAdminChecks
+from django.contrib.admin.options import BaseModelAdmin
+from django.contrib.auth.models import User
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist
+
+
+if TYPE_CHECKING:
+    from django_lockmin.admin import AdminLockingMixin
+
+
+class AdminLockingMixinChecks(ModelAdminChecks):
+    """
+    Extends the standard admin checks to validate the locking configuration of an admin view.
+
+    These are run once by Django's system check framework (e.g. on `runserver` or `check`), rather
+    than every time the admin view is initialised.
+    """
+
+    def check(
+        self, admin_obj: BaseModelAdmin, **kwargs: Any
+    ) -> list[checks.CheckMessage]:
+        # This is only ever set as the `checks_class` of `AdminLockingMixin`.
+        locking_admin = cast("AdminLockingMixin", admin_obj)
+        return [
+            *super().check(admin_obj, **kwargs),
+            *self._check_user_field(locking_admin),
+            *self._check_unlock_permission(locking_admin),
+        ]
+
+    def _check_user_field(self, obj: "AdminLockingMixin") -> list[checks.CheckMessage]:
+        """
+        Ensure that the model attached to the admin view has a correct user attribute so we can
+        track which user has locked a record.
+        """
+        try:
+            field = obj.model._meta.get_field(obj.user_field)
+        except FieldDoesNotExist:
+            return [
+                checks.Error(
+                    f"The `user_field` was set to `{obj.user_field}` but that's not a model field "
+                    f"of `{obj.model.__name__}`",
+                    obj=obj.__class__,
+                    id="lockmin.E001",
+                )
+            ]
+
+        if field.related_model != User:
+            return [
+                checks.Error(
+                    f"The `user_field` was set to `{obj.user_field}` but that isn't a foreign key "
+                    f"to the User table.",
+                    obj=obj.__class__,
+                    id="lockmin.E002",
+                )
+            ]
+
+        return self._check_user_field_index(obj, field)
+
+    def _check_user_field_index(
+        self, obj: "AdminLockingMixin", field: Any
+    ) -> list[checks.CheckMessage]:
+        """
+        Warn if the user field isn't indexed, as the records locked by a user are looked up every
+        time they try to lock a record.
+        """
+        if field.db_index or field.unique:
+            return []
+
+        field_names = {field.name, field.attname}
+        leading_fields = [
+            index.fields[0].lstrip("-")
+            for index in obj.model._meta.indexes
+            if index.fields
+        ]
+        leading_fields += [fields[0] for fields in obj.model._meta.unique_together]
+        if field_names.intersection(leading_fields):
+            return []
+
+        return [
+            checks.Warning(
+                f"The `user_field` `{obj.user_field}` of `{obj.model.__name__}` isn't indexed, so "
+                f"finding the records locked by a user will scan the whole table.",
+                hint=(
+                    f"Add an index to `{obj.model.__name__}.Meta.indexes`, e.g. `models.Index("
+                    f'fields=["{obj.user_field}"], condition=models.Q({obj.user_field}'
+                    f"__isnull=False), name=...)`."
+                ),
+                obj=obj.__class__,
+                id="lockmin.W001",
+            )
+        ]
+
+    def _check_unlock_permission(
+        self, obj: "AdminLockingMixin"
+    ) -> list[checks.CheckMessage]:
+        """
+        Warn if the unlock permission won't be created, as that's only done after running the
+        migrations when the app is installed.
+        """
+        if not obj.unlock_record_action_permission:
+            return []
+        if apps.is_installed("django_lockmin"):
+            return []
+
+        return [
+            checks.Warning(
+                "The `unlock_record_action_permission` is set but `django_lockmin` isn't in "
+                "`INSTALLED_APPS`, so the permission won't be created when running `migrate`.",
+                hint="Add `django_lockmin` to your `INSTALLED_APPS`.",
+                obj=obj.__class__,
+                id="lockmin.W002",
+            )
+        ]
@@ -0,0 +1,62 @@
+from typing import Any
+
+from django.apps import AppConfig, apps as global_apps
+from django.apps.registry import Apps
+from django.contrib.admin.sites import all_sites
+from django.db import DEFAULT_DB_ALIAS, router, transaction
+
+from django_lockmin.admin import AdminLockingMixin
+from django_lockmin.typing import PermissionType
+
+
+def create_unlock_permissions(
+    app_config: AppConfig,
+    using: str = DEFAULT_DB_ALIAS,
+    apps: Apps = global_apps,
+    **kwargs: Any,
+) -> None:
+    """
+    Creates the "unlock" permission for every locking admin view of the migrated app, across all
+    admin sites.
+
+    Connected to the `post_migrate` signal, so the permissions are created once when running
+    `migrate` rather than being checked for whenever an admin page is loaded. Mirrors Django's own
+    `django.contrib.auth.management.create_permissions`.
+    """
+    if not app_config.models_module:
+        return
+
+    # The auth and contenttypes apps may not have been migrated yet, e.g. `migrate contenttypes`.
+    try:
+        ContentType = apps.get_model("contenttypes", "ContentType")
+        Permission = apps.get_model("auth", "Permission")
+    except LookupError:
+        return
+
+    if not router.allow_migrate_model(using, Permission):
+        return
+
+    unlock_permissions: list[tuple[AdminLockingMixin, PermissionType]] = []
+    for site in all_sites:
+        for model, model_admin in site._registry.items():
+            if (
+                isinstance(model_admin, AdminLockingMixin)
+                and model_admin.unlock_record_action_permission
+                and model._meta.app_label == app_config.label
+            ):
+                unlock_permissions.append(
+                    (model_admin, model_admin.unlock_record_action_permission)
+                )
+
+    if not unlock_permissions:
+        return
+
+    with transaction.atomic(using=using):
+        for model_admin, permission in unlock_permissions:
+            Permission.objects.using(using).get_or_create(
+                content_type=ContentType.objects.db_manager(using).get_for_model(
+                    model_admin.model
+                ),
+                codename=model_admin._unlock_full_codename,
+                defaults={"name": permission.description},
+            )
@@ -0,0 +1,31 @@
+from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from django_lockmin.admin import AdminLockingMixin
+
+from tests.models import Invoice, Order, Secret, Ticket
+
+
+custom_site = admin.AdminSite(name="custom")
+
+
+@admin.register(Order)
+class OrderAdmin(AdminLockingMixin):
+    model_reference_key = "reference"
+
+
+@admin.register(Invoice, site=custom_site)
+class InvoiceAdmin(AdminLockingMixin):
+    pass
+
+
+@admin.register(Ticket)
+class TicketAdmin(AdminLockingMixin):
+    unlock_record_action_permission = None
+
+
+@admin.register(Secret)
+class SecretAdmin(AdminLockingMixin):
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).filter(owner=request.user.get_username())
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class Order(models.Model):
+    reference: models.CharField = models.CharField(max_length=32)
+    user: models.ForeignKey = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL
+    )
+
+
+class Invoice(models.Model):
+    order: models.ForeignKey = models.ForeignKey(Order, on_delete=models.CASCADE)
+    user: models.ForeignKey = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL, db_index=False
+    )
+
+
+class Ticket(models.Model):
+    user: models.ForeignKey = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL, db_index=False
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user"],
+                condition=models.Q(user__isnull=False),
+                name="ticket_active_locks",
+            ),
+        ]
+
+
+class Secret(models.Model):
+    owner: models.CharField = models.CharField(max_length=150)
+    user: models.ForeignKey = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL
+    )
@@ -0,0 +1,372 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, cast
+from unittest import mock
+
+import pytest
+from django.contrib import admin, messages
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import Permission, User
+from django.db import transaction
+from django.http import HttpResponseRedirect
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from django_lockmin.admin import AdminLockingMixin
+
+from tests.admin import OrderAdmin
+from tests.models import Order, Secret, Ticket
+
+
+@pytest.fixture
+def operator() -> User:
+    return User.objects.create_superuser("operator", password="password")
+
+
+@pytest.fixture
+def operator_client(operator: User) -> Client:
+    client = Client()
+    client.force_login(operator)
+    return client
+
+
+@pytest.mark.django_db
+class TestUnlockRecord:
+    def test_unlocks_selected_records(
+        self, operator: User, operator_client: Client
+    ) -> None:
+        orders = [Order.objects.create(reference=ref, user=operator) for ref in "AB"]
+        untouched = Order.objects.create(reference="C", user=operator)
+
+        response = operator_client.post(
+            reverse("admin:tests_order_changelist"),
+            {
+                "action": "unlock_record",
+                "_selected_action": [order.pk for order in orders],
+            },
+            follow=True,
+        )
+
+        assert list(
+            Order.objects.filter(user__isnull=True).values_list("reference", flat=True)
+        ) == ["A", "B"]
+        assert Order.objects.get(pk=untouched.pk).user == operator
+        [message] = [str(message) for message in response.context["messages"]]
+        prefix, references = message.split(": ")
+        assert prefix == "Successfully unlocked the following records"
+        assert sorted(references.split(", ")) == ["A", "B"]
+
+
+def _staff(username: str, *codenames: str) -> User:
+    user = User.objects.create_user(username, is_staff=True)
+    user.user_permissions.set(Permission.objects.filter(codename__in=codenames))
+    # Reload the user, as `request.user` would be, so there are no cached permissions.
+    return User.objects.get(pk=user.pk)
+
+
+@pytest.mark.django_db
+class TestUnlockPermission:
+    model_admin = cast(OrderAdmin, admin.site._registry[Order])
+
+    @pytest.mark.parametrize(
+        ("codenames", "expected"),
+        [(("view_order",), False), (("view_order", "unlock_order"), True)],
+    )
+    def test_has_unlock_permission(
+        self, codenames: tuple[str, ...], expected: bool
+    ) -> None:
+        request = RequestFactory().get("/")
+        request.user = _staff("staff", *codenames)
+
+        assert self.model_admin.has_unlock_permission(request) is expected
+
+    def test_reuses_the_permission_cache(self, django_assert_num_queries: Any) -> None:
+        request = RequestFactory().get("/")
+        request.user = _staff("staff", "view_order", "unlock_order")
+        request.user.has_perm("tests.view_order")
+
+        with django_assert_num_queries(0):
+            assert self.model_admin.has_unlock_permission(request)
+            assert self.model_admin.get_model_perms(request)["unlock"]
+
+    @pytest.mark.parametrize(
+        ("codenames", "expected"),
+        [
+            (("view_order",), ["lock_record"]),
+            (("view_order", "unlock_order"), ["unlock_record", "lock_record"]),
+        ],
+    )
+    def test_unlock_action_requires_permission(
+        self, codenames: tuple[str, ...], expected: list[str]
+    ) -> None:
+        request = RequestFactory().get("/")
+        request.user = _staff("staff", *codenames)
+
+        assert list(self.model_admin.get_actions(request)) == expected
+
+    def test_unlock_action_without_permission_controls(self) -> None:
+        ticket_admin = admin.site._registry[Ticket]
+        request = RequestFactory().get("/")
+        request.user = _staff("staff", "view_ticket")
+
+        assert list(ticket_admin.get_actions(request)) == [
+            "unlock_record",
+            "lock_record",
+        ]
+
+
+@pytest.mark.django_db
+class TestActionLabels:
+    def test_default_labels(self, operator: User) -> None:
+        request = RequestFactory().get("/")
+        request.user = operator
+
+        assert admin.site._registry[Order].get_action_choices(request)[2:] == [
+            ("unlock_record", "Unlock Record"),
+            ("lock_record", "Lock Record"),
+        ]
+
+    def test_labels_are_per_admin(self, operator: User) -> None:
+        class RenamedOrderAdmin(OrderAdmin):
+            lock_record_action_name = "Claim order"
+            unlock_record_action_name = "Release orders"
+
+        request = RequestFactory().get("/")
+        request.user = operator
+        model_admin = RenamedOrderAdmin(Order, AdminSite())
+
+        assert model_admin.get_action_choices(request)[2:] == [
+            ("unlock_record", "Release orders"),
+            ("lock_record", "Claim order"),
+        ]
+        assert admin.site._registry[Order].get_action_choices(request)[2:] == [
+            ("unlock_record", "Unlock Record"),
+            ("lock_record", "Lock Record"),
+        ]
+
+
+@pytest.mark.django_db
+class TestLockedByColumn:
+    def test_renders_the_locking_user(
+        self, operator_client: Client, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        Order.objects.create(reference="A")
+        Order.objects.create(
+            reference="B",
+            user=User.objects.create_user(
+                "ada", first_name="Ada", last_name="Lovelace"
+            ),
+        )
+        Order.objects.create(reference="C", user=User.objects.create_user("anon"))
+
+        response = operator_client.get(reverse("admin:tests_order_changelist"))
+
+        content = response.content.decode()
+        for display_name in ("-", "Ada Lovelace", "anon"):
+            assert f'<td class="field-is_locked_by">{display_name}</td>' in content
+        assert "The user `anon` has no first or last name set." in caplog.text
+
+    @pytest.mark.parametrize(
+        "order, expected",
+        [("2", ["B", "A", "C"]), ("-2", ["C", "A", "B"])],
+    )
+    def test_sorts_by_last_name(
+        self, operator_client: Client, order: str, expected: list[str]
+    ) -> None:
+        for reference, last_name in zip("ABC", ["Lovelace", "Zuse", "Babbage"]):
+            user = User.objects.create_user(reference, last_name=last_name)
+            Order.objects.create(reference=reference, user=user)
+
+        response = operator_client.get(
+            reverse("admin:tests_order_changelist"), {"o": order}
+        )
+
+        assert [
+            order.reference for order in response.context["cl"].result_list
+        ] == expected
+
+    def test_ordering_follows_the_user_field(self) -> None:
+        class ClaimedOrderAdmin(OrderAdmin):
+            user_field = "claimed_by"
+
+        assert getattr(ClaimedOrderAdmin.is_locked_by, "admin_order_field") == (
+            "-claimed_by__last_name"
+        )
+        assert getattr(OrderAdmin.is_locked_by, "admin_order_field") == (
+            "-user__last_name"
+        )
+
+
+def _lock(
+    model_admin: AdminLockingMixin, operator: User, *orders: Order
+) -> tuple[Optional[HttpResponseRedirect], mock.MagicMock]:
+    request = RequestFactory().post("/")
+    request.user = operator
+    queryset = Order.objects.filter(pk__in=[order.pk for order in orders])
+    with mock.patch.object(model_admin, "message_user") as message_user:
+        response = model_admin.lock_record(request, queryset)
+    return response, message_user
+
+
+@pytest.mark.django_db
+class TestLockRecord:
+    model_admin = cast(OrderAdmin, admin.site._registry[Order])
+
+    def test_redirects_to_the_selected_record(self, operator: User) -> None:
+        order = Order.objects.create(reference="A")
+
+        response, message_user = _lock(self.model_admin, operator, order)
+
+        assert response is not None
+        assert response.url == reverse("admin:tests_order_change", args=[order.pk])
+        message_user.assert_not_called()
+
+    @pytest.mark.parametrize("selected", [0, 2, 3])
+    def test_requires_a_single_record(self, operator: User, selected: int) -> None:
+        orders = [Order.objects.create(reference=str(i)) for i in range(selected)]
+
+        response, message_user = _lock(self.model_admin, operator, *orders)
+
+        assert response is None
+        message_user.assert_called_once_with(
+            mock.ANY,
+            message="Please select exactly one record to lock.",
+            level=messages.ERROR,
+        )
+
+    @pytest.mark.parametrize(
+        ("max_records_lockable", "already_locked", "relock", "exceeded"),
+        [
+            (1, 0, False, False),
+            (1, 1, False, True),
+            (1, 1, True, False),
+            (2, 1, False, False),
+            (2, 2, False, True),
+            (2, 2, True, False),
+            (2, 5, True, True),
+        ],
+    )
+    def test_max_records_lockable(
+        self,
+        operator: User,
+        max_records_lockable: int,
+        already_locked: int,
+        relock: bool,
+        exceeded: bool,
+    ) -> None:
+        class LimitedOrderAdmin(OrderAdmin):
+            pass
+
+        LimitedOrderAdmin.max_records_lockable = max_records_lockable
+        locked = [
+            Order.objects.create(reference=f"locked-{i}", user=operator)
+            for i in range(already_locked)
+        ]
+        order = locked[0] if relock else Order.objects.create(reference="new")
+
+        response, message_user = _lock(
+            LimitedOrderAdmin(Order, AdminSite()), operator, order
+        )
+
+        # The user can still go on to view the record either way.
+        assert response is not None
+        assert response.url == reverse("admin:tests_order_change", args=[order.pk])
+        if exceeded:
+            message_user.assert_called_once_with(
+                mock.ANY,
+                message=LimitedOrderAdmin.max_records_warning_msg,
+                level=messages.ERROR,
+            )
+        else:
+            message_user.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestChangeView:
+    def test_malformed_object_id(self, operator_client: Client) -> None:
+        response = operator_client.get("/admin/tests/order/abc/change/")
+
+        assert response.status_code == 302
+
+    def test_missing_object_id(self, operator_client: Client) -> None:
+        response = operator_client.get(reverse("admin:tests_order_change", args=[1]))
+
+        assert response.status_code == 302
+
+    def test_claims_unlocked_record(
+        self, operator: User, operator_client: Client
+    ) -> None:
+        order = Order.objects.create(reference="A")
+
+        response = operator_client.get(
+            reverse("admin:tests_order_change", args=[order.pk])
+        )
+
+        assert response.status_code == 200
+        order.refresh_from_db()
+        assert order.user == operator
+
+    def test_record_locked_by_current_user(
+        self, operator: User, operator_client: Client
+    ) -> None:
+        order = Order.objects.create(reference="A", user=operator)
+
+        response = operator_client.get(
+            reverse("admin:tests_order_change", args=[order.pk])
+        )
+
+        assert response.status_code == 200
+
+    def test_record_locked_by_another_user(self, operator_client: Client) -> None:
+        other = User.objects.create_user("other")
+        order = Order.objects.create(reference="A", user=other)
+
+        response = operator_client.get(
+            reverse("admin:tests_order_change", args=[order.pk])
+        )
+
+        assert response.status_code == 302
+        order.refresh_from_db()
+        assert order.user == other
+
+    def test_record_hidden_by_get_queryset(self, operator_client: Client) -> None:
+        secret = Secret.objects.create(owner="someone-else")
+
+        response = operator_client.get(
+            reverse("admin:tests_secret_change", args=[secret.pk])
+        )
+
+        assert response.status_code == 302
+        secret.refresh_from_db()
+        assert secret.user is None
+
+    def test_visible_record_is_claimed(
+        self, operator: User, operator_client: Client
+    ) -> None:
+        secret = Secret.objects.create(owner=operator.username)
+
+        response = operator_client.get(
+            reverse("admin:tests_secret_change", args=[secret.pk])
+        )
+
+        assert response.status_code == 200
+        secret.refresh_from_db()
+        assert secret.user == operator
+
+    def test_record_deleted_before_claiming(self, operator_client: Client) -> None:
+        order = Order.objects.create(reference="A")
+        atomic = transaction.atomic
+
+        # Delete the record just before it's claimed, i.e. after the lock pre-check.
+        @contextmanager
+        def delete_then_atomic(using: Optional[str] = None) -> Iterator[None]:
+            with mock.patch.object(transaction, "atomic", atomic):
+                Order.objects.filter(pk=order.pk).delete()
+            with atomic(using=using):
+                yield
+
+        with mock.patch.object(transaction, "atomic", delete_then_atomic):
+            response = operator_client.get(
+                reverse("admin:tests_order_change", args=[order.pk])
+            )
+
+        assert response.status_code == 302
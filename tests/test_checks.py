@@ -0,0 +1,45 @@
+from django.contrib.admin import AdminSite
+from django.test import modify_settings
+
+from tests.admin import InvoiceAdmin, OrderAdmin, TicketAdmin
+from tests.models import Invoice, Order, Ticket
+
+
+def _lockmin_ids(model_admin: object) -> list[str]:
+    return [
+        message.id
+        for message in model_admin.check()  # type: ignore[attr-defined]
+        if message.id.startswith("lockmin.")
+    ]
+
+
+def test_valid_admin_has_no_lockmin_messages() -> None:
+    assert _lockmin_ids(OrderAdmin(Order, AdminSite())) == []
+
+
+def test_missing_user_field() -> None:
+    class MissingUserFieldAdmin(OrderAdmin):
+        user_field = "missing"
+
+    assert _lockmin_ids(MissingUserFieldAdmin(Order, AdminSite())) == ["lockmin.E001"]
+
+
+def test_user_field_not_a_user_foreign_key() -> None:
+    class OrderUserFieldAdmin(InvoiceAdmin):
+        user_field = "order"
+
+    assert _lockmin_ids(OrderUserFieldAdmin(Invoice, AdminSite())) == ["lockmin.E002"]
+
+
+def test_unindexed_user_field() -> None:
+    assert _lockmin_ids(InvoiceAdmin(Invoice, AdminSite())) == ["lockmin.W001"]
+
+
+def test_user_field_indexed_through_meta_indexes() -> None:
+    assert _lockmin_ids(TicketAdmin(Ticket, AdminSite())) == []
+
+
+@modify_settings(INSTALLED_APPS={"remove": ["django_lockmin"]})
+def test_unlock_permission_without_app_installed() -> None:
+    assert _lockmin_ids(OrderAdmin(Order, AdminSite())) == ["lockmin.W002"]
+    assert _lockmin_ids(TicketAdmin(Ticket, AdminSite())) == []
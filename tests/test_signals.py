@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+
+from django_lockmin.signals import create_unlock_permissions
+
+
+@pytest.mark.django_db
+def test_unlock_permissions_created_on_migrate() -> None:
+    # Both the default and the custom admin site's locking admins get their permission.
+    assert set(
+        Permission.objects.filter(codename__startswith="unlock_").values_list(
+            "codename", "name"
+        )
+    ) == {
+        ("unlock_order", "Can unlock a record."),
+        ("unlock_invoice", "Can unlock a record."),
+        ("unlock_secret", "Can unlock a record."),
+    }
+
+
+@pytest.mark.django_db
+def test_missing_unlock_permission_is_recreated() -> None:
+    Permission.objects.filter(codename="unlock_order").delete()
+
+    create_unlock_permissions(app_config=apps.get_app_config("tests"))
+    create_unlock_permissions(app_config=apps.get_app_config("tests"))
+
+    assert Permission.objects.filter(codename="unlock_order").count() == 1
+
+
+@pytest.mark.django_db
+def test_unlock_permissions_only_created_for_the_migrated_app() -> None:
+    Permission.objects.filter(codename="unlock_order").delete()
+
+    create_unlock_permissions(app_config=apps.get_app_config("auth"))
+
+    assert not Permission.objects.filter(codename="unlock_order").exists()
+
+
+@pytest.mark.django_db
+def test_skipped_for_apps_without_models(django_assert_num_queries: Any) -> None:
+    with django_assert_num_queries(0):
+        create_unlock_permissions(app_config=apps.get_app_config("lockmin"))
+
+
+@pytest.mark.django_db
+def test_skipped_before_auth_is_migrated(django_assert_num_queries: Any) -> None:
+    # i.e. running `migrate contenttypes` on a fresh database.
+    state = MigrationLoader(connection).project_state(
+        ("contenttypes", "0002_remove_content_type_name")
+    )
+    Permission.objects.filter(codename="unlock_order").delete()
+
+    with django_assert_num_queries(0):
+        create_unlock_permissions(
+            app_config=apps.get_app_config("tests"), apps=state.apps
+        )
+
+    assert not Permission.objects.filter(codename="unlock_order").exists()
+
+
+@pytest.mark.django_db
+def test_uses_the_migration_state_models() -> None:
+    Permission.objects.filter(codename="unlock_order").delete()
+    state = MigrationLoader(connection).project_state()
+
+    create_unlock_permissions(app_config=apps.get_app_config("tests"), apps=state.apps)
+
+    assert Permission.objects.filter(codename="unlock_order").exists()
@@ -0,0 +1,10 @@
+from django.contrib import admin
+from django.urls import path
+
+from tests.admin import custom_site
+
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("custom-admin/", custom_site.urls),
+]